@@ -3,8 +3,11 @@
 REM Build dependencies using Docker with Amazon Linux
 echo Building dependencies for AWS Lambda (Linux)...
 
-REM Create output directory
-if not exist lambda_deps mkdir lambda_deps
+REM Start from a clean output directory so packages from previous builds
+REM do not end up in the deployment zip
+if exist lambda_deps rmdir /s /q lambda_deps
+if exist lambda_deployment.zip del lambda_deployment.zip
+mkdir lambda_deps
 
 REM Build Docker image
 echo Building Docker image...
@@ -3,7 +3,9 @@
 # Build dependencies using Docker with Amazon Linux
 echo "Building dependencies for AWS Lambda (Linux)..."
 
-# Create output directory
+# Start from a clean output directory so packages from previous builds
+# do not end up in the deployment zip
+rm -rf lambda_deps lambda_deployment.zip
 mkdir -p lambda_deps
 
 # Build Docker image
@@ -1,10 +1,110 @@
+import hmac
+import http.client
 import json
 import os
 import logging
-import requests
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from functools import lru_cache
+from typing import Optional
+from urllib.parse import urlsplit
+
+# orjson is much faster than the stdlib json module; fall back to json
+# if it is not bundled in the deployment package.
+try:
+    import orjson
+
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj):
+        return json.dumps(obj).encode("utf-8")
+
+    _loads = json.loads
+
+# ijson lets us parse the Keystone service catalog incrementally; without it
+# the whole token response is decoded at once.
+try:
+    import ijson
+except ImportError:
+    ijson = None
 
 log = logging.getLogger()
-log.setLevel(logging.INFO)
+# Set LOG_LEVEL=WARNING to skip the per-request INFO lines in production
+log.setLevel(os.environ.get("LOG_LEVEL", "INFO").upper())
+
+# Persistent HTTP connections, one per host and thread, kept for the life of
+# the container so warm invocations reuse the TCP/TLS connections to Keystone
+# and Nova. We only ever talk to these two hosts, so the stdlib http.client is
+# all we need and it is much cheaper to import than requests or urllib3.
+_CONNECTIONS = threading.local()
+_HTTP_TIMEOUT = 5
+# Errors meaning the server closed an idle keep-alive connection, or that a
+# previous response on it was not fully read: reconnect and try again
+_RECONNECT_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.CannotSendRequest,
+    http.client.ResponseNotReady,
+    ConnectionResetError,
+    BrokenPipeError,
+)
+
+@lru_cache(maxsize=16)
+def _split_url(url):
+    """Splits a URL into ((scheme, netloc), path) for use with _send."""
+    parts = urlsplit(url)
+    return (parts.scheme, parts.netloc), parts.path
+
+def _connection(target):
+    conns = _CONNECTIONS.__dict__.setdefault("conns", {})
+    conn = conns.get(target)
+    if conn is None:
+        scheme, netloc = target
+        if scheme == "https":
+            conn = http.client.HTTPSConnection(netloc, timeout=_HTTP_TIMEOUT)
+        else:
+            conn = http.client.HTTPConnection(netloc, timeout=_HTTP_TIMEOUT)
+        conns[target] = conn
+    return conn
+
+def _send(target, method, path, body=None, headers=None):
+    """
+    Sends a request over the persistent connection to target and returns the
+    response. The caller must read the response fully before the next request.
+    """
+    conn = _connection(target)
+    try:
+        conn.request(method, path, body=body, headers=headers or {})
+        return conn.getresponse()
+    except _RECONNECT_ERRORS:
+        conn.close()
+        conn.request(method, path, body=body, headers=headers or {})
+        return conn.getresponse()
+
+class OpenStackHTTPError(RuntimeError):
+    """Raised when an OpenStack API answers with an HTTP error status."""
+
+    def __init__(self, status, method, url):
+        super().__init__(f"{status} error for {method} {url}")
+        self.status = status
+
+# Keystone tokens are valid for hours: cache them per region across warm
+# invocations as (token, compute_endpoint, expires_epoch).
+_TOKEN_CACHE: dict[str, tuple[str, str, float]] = {}
+# Refresh the token when it has less than this many seconds left
+_TOKEN_EXPIRY_MARGIN = 60
+# Below this many seconds left, refresh the token in the background while
+# the old one is still used for the Nova GET
+_TOKEN_REFRESH_AHEAD = 120
+_EXECUTOR = ThreadPoolExecutor(max_workers=1)
+
+# Last observed state per instance as (state, expires_epoch), so that a
+# start/stop right after a status call can skip the Nova GET.
+_STATE_CACHE: dict[str, tuple[str, float]] = {}
+_STATE_CACHE_TTL = 5
 
 # API KEY CONFIGURATION
 # ====================
@@ -32,33 +132,57 @@ if ENABLE_API_KEY:
 
 def _json(status, body):
     return {"statusCode": status, "headers": {"Content-Type": "application/json"},
-            "body": json.dumps(body)}
+            "body": _dumps(body).decode("utf-8")}
 
 def _require_envs():
     missing = [k for k in REQUIRED_ENVS if not os.environ.get(k)]
     if missing:
         raise RuntimeError(f"Missing required envs: {', '.join(missing)}")
 
+@dataclass(frozen=True, slots=True)
+class Config:
+    """Environment configuration, read once per container."""
+    auth_url: str
+    username: str
+    password: str
+    project_id: str
+    api_key: Optional[str]
+    default_region: Optional[str]
+    default_instance: Optional[str]
+
+def _load_config():
+    return Config(
+        auth_url=os.environ["OS_AUTH_URL"],
+        username=os.environ["OS_USERNAME"],
+        password=os.environ["OS_PASSWORD"],
+        project_id=os.environ["OS_PROJECT_ID"],
+        api_key=os.environ.get("API_KEY"),
+        default_region=os.environ.get("OS_REGION_NAME"),
+        default_instance=os.environ.get("INSTANCE_ID"),
+    )
+
+# The environment never changes during the life of the container: fail fast
+# during the init phase if it is incomplete, then only use _CFG.
+_require_envs()
+_CFG = _load_config()
+# Encoded once for the constant-time comparison in _check_api_key
+_EXPECTED_KEY_B = (_CFG.api_key or "").encode("utf-8")
+
 def _check_api_key(event):
     """
-    Verifies the API key from the request if enabled.
+    Verifies the API key from the request.
     The API key can be provided via:
     - Header 'X-API-Key'
     - Query parameter 'api_key'
     
-    If ENABLE_API_KEY is False, this function does nothing.
+    Only called when ENABLE_API_KEY is True, see _maybe_check_api_key.
     """
-    if not ENABLE_API_KEY:
-        log.info("API key authentication is disabled")
-        return  # Skip API key validation
-    
-    expected_api_key = os.environ.get("API_KEY")
-    if not expected_api_key:
+    if not _EXPECTED_KEY_B:
         raise RuntimeError("API_KEY environment variable not configured")
     
-    # Check in headers
+    # Check in headers (header names are case-insensitive)
     headers = (event or {}).get("headers") or {}
-    provided_api_key = headers.get("X-API-Key") or headers.get("x-api-key")
+    provided_api_key = {k.lower(): v for k, v in headers.items()}.get("x-api-key")
     
     # If not found in headers, check query parameters
     if not provided_api_key:
@@ -68,112 +192,303 @@ def _check_api_key(event):
     if not provided_api_key:
         raise RuntimeError("API key not provided. Use X-API-Key header or api_key query parameter")
     
-    if provided_api_key != expected_api_key:
+    # Constant-time comparison, so the key cannot be guessed from response times
+    if not hmac.compare_digest(provided_api_key.encode("utf-8"), _EXPECTED_KEY_B):
         raise RuntimeError("Invalid API key")
     
     log.info("API key validation successful")
 
-def _get_token_and_compute_url(region):
-    """
-    Authenticate with username/password to get a token and Compute service endpoint.
+def _skip_api_key_check(event):
+    return None
 
-    :param region: region name to use for the service catalog
-    """
-    auth_url = os.environ["OS_AUTH_URL"]
-    username = os.environ["OS_USERNAME"]
-    password = os.environ["OS_PASSWORD"]
-    project_id = os.environ["OS_PROJECT_ID"]
+# ENABLE_API_KEY never changes at runtime: pick the check once at import
+# instead of testing the flag on every invocation
+if ENABLE_API_KEY:
+    _maybe_check_api_key = _check_api_key
+else:
+    log.info("API key authentication is disabled")
+    _maybe_check_api_key = _skip_api_key_check
 
-    # OpenStack v3 authentication request body
+def _build_auth_body():
+    """Builds the serialized OpenStack v3 password authentication request body."""
     auth_payload = {
         "auth": {
             "identity": {
                 "methods": ["password"],
                 "password": {
                     "user": {
-                        "name": username,
+                        "name": _CFG.username,
                         "domain": {"id": "default"},
-                        "password": password
+                        "password": _CFG.password
                     }
                 }
             },
             "scope": {
                 "project": {
-                    "id": project_id
+                    "id": _CFG.project_id
                 }
             }
         }
     }
+    return _dumps(auth_payload)
 
-    # The URL to get the token is the authentication endpoint + /auth/tokens
-    token_url = f"{auth_url.rstrip('/')}/auth/tokens"
-    
-    log.info(f"Requesting token from: {token_url}")
-    response = requests.post(token_url, json=auth_payload)
-    response.raise_for_status()
+# The credentials never change during the life of the container, so build
+# the token URL and serialize the auth body once at cold start.
+# The URL to get the token is the authentication endpoint + /auth/tokens
+_TOKEN_URL = _CFG.auth_url.rstrip('/') + "/auth/tokens"
+_AUTH_BODY_BYTES = _build_auth_body()
+_AUTH_TARGET, _TOKEN_PATH = _split_url(_TOKEN_URL)
 
-    # The token is returned in the response headers!
-    token = response.headers['X-Subject-Token']
-    
-    # The response body contains the "service catalog" with URLs of all services
-    service_catalog = response.json()['token']['catalog']
-    
-    # Find the URL of the "compute" service for our region
-    compute_endpoint = None
-    for service in service_catalog:
-        if service['type'] == 'compute':
-            for endpoint in service['endpoints']:
-                if endpoint['region_id'] == region and endpoint['interface'] == 'public':
-                    compute_endpoint = endpoint['url']
-                    break
-            if compute_endpoint:
-                break
-    
-    if not token or not compute_endpoint:
+def _warm_auth_connection():
+    """
+    Opens the connection to Keystone (DNS, TCP and TLS handshake) during the
+    Lambda init phase, so the first token request of the container reuses it.
+    Failures are ignored: the real request will simply connect again.
+    """
+    try:
+        _connection(_AUTH_TARGET).connect()
+    except OSError as e:
+        _connection(_AUTH_TARGET).close()
+        log.info("Could not pre-open connection to %s: %s", _TOKEN_URL, e)
+
+_warm_auth_connection()
+
+# Base headers for Compute API requests, copied and completed with the token
+_NOVA_HEADERS_TMPL = {"Content-Type": "application/json"}
+
+def _check_status(resp, method, url):
+    if resp.status >= 400:
+        # Consume the error body so the connection stays usable
+        resp.read()
+        raise OpenStackHTTPError(resp.status, method, url)
+
+def _find_compute_endpoint(service_catalog, region):
+    """
+    Finds the URL of the public "compute" service endpoint for our region.
+    Some catalogs use "region" instead of "region_id" on endpoints.
+    """
+    return next(
+        (endpoint['url']
+         for service in service_catalog if service['type'] == 'compute'
+         for endpoint in service['endpoints']
+         if (endpoint.get('region_id') or endpoint.get('region')) == region
+         and endpoint['interface'] == 'public'),
+        None,
+    )
+
+def _parse_token_body(stream, region):
+    """
+    Reads the token expiry and compute endpoint from a Keystone token response.
+
+    With ijson the catalog is decoded one service at a time and parsing stops
+    as soon as both values are known, instead of building the whole document.
+
+    :param stream: file-like object with the response body
+    :return: (expires_at string, compute endpoint URL), either may be None
+    """
+    if ijson is None:
+        token_data = _loads(stream.read())['token']
+        return token_data.get('expires_at'), _find_compute_endpoint(token_data['catalog'], region)
+
+    expires_at = compute_endpoint = None
+    service = None
+    for prefix, event, value in ijson.parse(stream):
+        if service is not None:
+            service.event(event, value)
+            if prefix == "token.catalog.item" and event == "end_map":
+                compute_endpoint = _find_compute_endpoint([service.value], region)
+                service = None
+        elif prefix == "token.expires_at":
+            expires_at = value
+        elif prefix == "token.catalog.item" and event == "start_map" and compute_endpoint is None:
+            service = ijson.ObjectBuilder()
+            service.event(event, value)
+        if expires_at and compute_endpoint:
+            break
+    return expires_at, compute_endpoint
+
+def _get_token_and_compute_url(region):
+    """
+    Authenticate with username/password to get a token and Compute service endpoint.
+
+    The token is cached per region and reused until it is about to expire.
+
+    :param region: region name to use for the service catalog
+    """
+    cached = _TOKEN_CACHE.get(region)
+    if cached and cached[2] - time.time() > _TOKEN_EXPIRY_MARGIN:
+        return cached[0], cached[1]
+    return _refresh_token(region)
+
+def _refresh_token(region):
+    """Requests a new token from Keystone and stores it in the cache."""
+    log.info("Requesting token from: %s", _TOKEN_URL)
+    response = _send(_AUTH_TARGET, "POST", _TOKEN_PATH, _AUTH_BODY_BYTES,
+                     {"Content-Type": "application/json"})
+    try:
+        _check_status(response, "POST", _TOKEN_URL)
+
+        # The token is returned in the response headers!
+        token = response.getheader('X-Subject-Token')
+
+        # The response body contains the "service catalog" with URLs of all services
+        expires_at, compute_endpoint = _parse_token_body(response, region)
+    finally:
+        # Read whatever is left so the connection can be reused
+        response.read()
+
+    if not token or not compute_endpoint or not expires_at:
         raise RuntimeError("Could not retrieve token or compute endpoint from OpenStack.")
+    # Strip once here so each Compute API call can simply append its path
+    compute_endpoint = compute_endpoint.rstrip('/')
 
-    log.info(f"Token obtained successfully. Compute endpoint: {compute_endpoint}")
+    # expires_at looks like "2025-01-01T12:00:00.000000Z"; Python 3.10 does not parse "Z"
+    expires_at = datetime.fromisoformat(expires_at.replace("Z", "+00:00"))
+    _TOKEN_CACHE[region] = (token, compute_endpoint, expires_at.timestamp())
+
+    log.info("Token obtained successfully. Compute endpoint: %s", compute_endpoint)
     return token, compute_endpoint
 
-def _make_compute_request(method, path, token, compute_endpoint, data=None):
-    """Makes a request to the OpenStack Compute API."""
-    url = f"{compute_endpoint.rstrip('/')}{path}"
-    log.info(f"Making request to: {url}")
+def _make_compute_request(method, path, token, compute_endpoint, data_bytes=None):
+    """
+    Makes a request to the OpenStack Compute API.
+
+    :param compute_endpoint: endpoint URL without trailing slash
+    :param data_bytes: already serialized JSON request body, if any
+    """
+    url = compute_endpoint + path
+    log.info("Making request to: %s", url)
     
-    headers = {
-        "X-Auth-Token": token,
-        "Content-Type": "application/json"
-    }
+    headers = _NOVA_HEADERS_TMPL.copy()
+    headers["X-Auth-Token"] = token
     
-    response = requests.request(method, url, headers=headers, json=data)
-    response.raise_for_status()
+    target, base_path = _split_url(compute_endpoint)
+    response = _send(target, method, base_path + path, data_bytes, headers)
+    if response.status == 204:
+        # No content: nothing to read, the connection is ready for reuse
+        response.close()
+        return None
+    _check_status(response, method, url)
+    data = response.read()
     
     # Some responses (e.g., POST) might not have a body
-    if response.status_code != 204 and response.content:
-        return response.json()
+    return _loads(data) if data else None
+
+def _compute_request(region, method, path, data_bytes=None):
+    """
+    Makes a request to the OpenStack Compute API using the cached token.
+
+    If the token has been revoked (401), it is dropped from the cache and the
+    request is retried once with a fresh token.
+    """
+    cached = _TOKEN_CACHE.get(region)
+    if method == "GET" and cached and 0 < cached[2] - time.time() < _TOKEN_REFRESH_AHEAD:
+        return _get_while_refreshing(region, path, cached[0], cached[1])
+
+    token, compute_endpoint = _get_token_and_compute_url(region)
+    try:
+        return _make_compute_request(method, path, token, compute_endpoint, data_bytes)
+    except OpenStackHTTPError as e:
+        if e.status != 401:
+            raise
+        log.info("Token rejected for region %s, requesting a new one", region)
+        _TOKEN_CACHE.pop(region, None)
+        token, compute_endpoint = _get_token_and_compute_url(region)
+        return _make_compute_request(method, path, token, compute_endpoint, data_bytes)
+
+def _get_while_refreshing(region, path, token, compute_endpoint):
+    """
+    Issues a GET with a token close to expiry while a new token is requested
+    in parallel, so the two round trips overlap instead of being serialized.
+    """
+    refresh_fut = _EXECUTOR.submit(_refresh_token, region)
+    try:
+        return _make_compute_request("GET", path, token, compute_endpoint)
+    except OpenStackHTTPError as e:
+        if e.status != 401:
+            raise
+        log.info("Token rejected for region %s, waiting for the new one", region)
+        token, compute_endpoint = refresh_fut.result()
+        return _make_compute_request("GET", path, token, compute_endpoint)
+    finally:
+        # Never leave the refresh running while Lambda freezes the container
+        if refresh_fut.exception() is not None:
+            log.warning("Token refresh failed for region %s: %s", region, refresh_fut.exception())
+
+# Serialized server action bodies, they never change
+_BODY_UNSHELVE = b'{"unshelve": null}'
+_BODY_SHELVE = b'{"shelve": null}'
+_BODY_OSSTART = b'{"os-start": null}'
+
+# (action, state) -> (action request body or None, message, include from_state).
+# A None body means the instance is already in the requested state.
+_ACTION_TABLE = {
+    ("start", "SHELVED"): (_BODY_UNSHELVE, "unshelve requested", True),
+    ("start", "SHELVED_OFFLOADED"): (_BODY_UNSHELVE, "unshelve requested", True),
+    ("start", "ACTIVE"): (None, "already active", False),
+    ("stop", "SHELVED"): (None, "already shelved", False),
+    ("stop", "SHELVED_OFFLOADED"): (None, "already shelved", False),
+    ("stop", "ACTIVE"): (_BODY_SHELVE, "shelve requested from ACTIVE", False),
+    ("stop", "SHUTOFF"): (_BODY_SHELVE, "shelve requested from SHUTOFF", False),
+}
+# Used when the current state has no specific entry (fallback: try anyway)
+_ACTION_DEFAULT = {
+    "start": (_BODY_OSSTART, "start requested", True),
+    "stop": (_BODY_SHELVE, "shelve requested", True),
+}
+
+# Common spellings of the accepted actions and the states we act on, so the
+# usual case is a single dict lookup instead of building new strings
+_ACTION_NORMALIZE = {
+    "start": "start", "START": "start", "Start": "start",
+    "stop": "stop", "STOP": "stop", "Stop": "stop",
+    "status": "status", "STATUS": "status", "Status": "status",
+}
+_STATE_NORMALIZE = {s: s for s in ("ACTIVE", "SHELVED", "SHELVED_OFFLOADED", "SHUTOFF")}
+
+def _fetch_server_state(region, instance_id):
+    """Reads the instance state from Nova and caches it, or returns None if not found."""
+    server_data = _compute_request(region, "GET", f"/servers/{instance_id}")
+    if not server_data or "server" not in server_data:
+        return None
+    status = server_data["server"]["status"]
+    state = _STATE_NORMALIZE.get(status) or status.upper()
+    _STATE_CACHE[instance_id] = (state, time.time() + _STATE_CACHE_TTL)
+    return state
+
+def _cached_server_state(instance_id):
+    cached = _STATE_CACHE.get(instance_id)
+    if cached and cached[1] > time.time():
+        return cached[0]
     return None
 
+def _apply_action(region, instance_id, action, state):
+    body, message, with_from_state = _ACTION_TABLE.get((action, state)) or _ACTION_DEFAULT[action]
+    if body is not None:
+        _compute_request(region, "POST", f"/servers/{instance_id}/action", body)
+        # The instance is now transitioning, the cached state is stale
+        _STATE_CACHE.pop(instance_id, None)
+    if with_from_state:
+        return _json(200, {"message": message, "from_state": state})
+    return _json(200, {"message": message})
+
 def lambda_handler(event, context):
     try:
-        _require_envs()
-        
-        # Verify API key only if enabled
-        if ENABLE_API_KEY:
-            try:
-                _check_api_key(event)
-            except RuntimeError as e:
-                log.warning(f"API key validation failed: {str(e)}")
-                return _json(401, {"error": "unauthorized", "message": str(e)})
+        # Verify API key (a no-op when disabled)
+        try:
+            _maybe_check_api_key(event)
+        except RuntimeError as e:
+            log.warning("API key validation failed: %s", e)
+            return _json(401, {"error": "unauthorized", "message": str(e)})
         
         qs = (event or {}).get("queryStringParameters") or {}
-        action = (qs.get("action") or "status").lower().strip()
-
-        allowed = {"start", "stop", "status"}
-        if action not in allowed:
-            return _json(400, {"error": "invalid_action", "allowed": list(allowed)})
+        raw_action = (qs.get("action") or "status").strip()
+        action = _ACTION_NORMALIZE.get(raw_action) or _ACTION_NORMALIZE.get(raw_action.lower())
+        if action is None:
+            return _json(400, {"error": "invalid_action", "allowed": ["start", "stop", "status"]})
 
-        region = qs.get("region") or os.environ.get("OS_REGION_NAME")
-        instance_id = qs.get("instance_id") or os.environ.get("INSTANCE_ID")
+        region = qs.get("region") or _CFG.default_region
+        instance_id = qs.get("instance_id") or _CFG.default_instance
 
         missing = []
         if not region:
@@ -183,44 +498,36 @@ def lambda_handler(event, context):
         if missing:
             return _json(400, {"error": "missing_parameters", "missing": missing})
 
-        # Get a fresh token on each execution!
-        token, compute_endpoint = _get_token_and_compute_url(region)
+        not_found = _json(404, {"error": "instance_not_found or invalid response", "instance_id": instance_id})
 
-        server_data = _make_compute_request("GET", f"/servers/{instance_id}", token, compute_endpoint)
-        if not server_data or "server" not in server_data:
-             return _json(404, {"error": "instance_not_found or invalid response", "instance_id": instance_id})
-        
-        server = server_data["server"]
-        state = server["status"].upper()
-        log.info(f"Instance {instance_id} state: {state}")
+        # status always reads the live state; start/stop may reuse a recent one
+        state = None if action == "status" else _cached_server_state(instance_id)
+        from_cache = state is not None
+        if not from_cache:
+            state = _fetch_server_state(region, instance_id)
+            if state is None:
+                return not_found
+        if log.isEnabledFor(logging.INFO):
+            log.info("Instance %s state: %s%s", instance_id, state, " (cached)" if from_cache else "")
 
         if action == "status":
             return _json(200, {"instance_id": instance_id, "state": state})
 
-        if action == "start":
-            if state in {"SHELVED", "SHELVED_OFFLOADED"}:
-                _make_compute_request("POST", f"/servers/{instance_id}/action", token, compute_endpoint, {"unshelve": None})
-                return _json(200, {"message": "unshelve requested", "from_state": state})
-            if state == "ACTIVE":
-                return _json(200, {"message": "already active"})
-            _make_compute_request("POST", f"/servers/{instance_id}/action", token, compute_endpoint, {"os-start": None})
-            return _json(200, {"message": "start requested", "from_state": state})
-
-        if action == "stop":
-            if state in {"SHELVED", "SHELVED_OFFLOADED"}:
-                return _json(200, {"message": "already shelved"})
-            if state == "ACTIVE":
-                _make_compute_request("POST", f"/servers/{instance_id}/action", token, compute_endpoint, {"shelve": None})
-                return _json(200, {"message": "shelve requested from ACTIVE"})
-            if state == "SHUTOFF":
-                _make_compute_request("POST", f"/servers/{instance_id}/action", token, compute_endpoint, {"shelve": None})
-                return _json(200, {"message": "shelve requested from SHUTOFF"})
-            # fallback: try shelve anyway
-            _make_compute_request("POST", f"/servers/{instance_id}/action", token, compute_endpoint, {"shelve": None})
-            return _json(200, {"message": "shelve requested", "from_state": state})
+        try:
+            return _apply_action(region, instance_id, action, state)
+        except OpenStackHTTPError as e:
+            if e.status != 409 or not from_cache:
+                raise
+            # Conflict: the cached state was stale, read the live one and retry
+            log.info("Cached state %s is stale for instance %s", state, instance_id)
+            _STATE_CACHE.pop(instance_id, None)
+            state = _fetch_server_state(region, instance_id)
+            if state is None:
+                return not_found
+            return _apply_action(region, instance_id, action, state)
 
     except Exception as e:
-        log.exception("Unhandled error")
+        log.exception("Unhandled %s", type(e).__name__)
         # Include more details in the error for debugging
-        error_detail = f"{type(e).__name__}: {str(e)}"
+        error_detail = f"{type(e).__name__}: {e}"
         return _json(500, {"error": "internal_error", "detail": error_detail})